@@ -1,6 +1,24 @@
-import matplotlib.pyplot as plt
+import numpy as np
 import math # Using math.isclose for float comparison
 
+try:
+    from numba import njit, prange
+except ImportError: # Numba is optional, the kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+MIN_STEP = 1e-6 # Smallest adaptive integration step (s)
+MAX_STEP_FRACTION = 0.01 # Largest adaptive step as a fraction of max_time
+INITIAL_SAMPLES = 4096 # Starting length of the sample buffers, doubled when full
+
+# Every fast-math flag except reassociation, which would let LLVM cancel the
+# compensated position sum in _integrate_drag. Shared by all kernels.
+FASTMATH = {'nnan', 'ninf', 'nsz', 'arcp', 'contract', 'afn'}
+
 def get_float_input(prompt):
     """Gets and validates float input from the user."""
     while True:
@@ -22,7 +40,8 @@ def simulate_drag(
     force_constant, # Added constant force input
     initial_position=0.0,
     time_step=0.01,
-    max_time=100.0
+    max_time=100.0,
+    tolerance=1e-9
 ):
     """
     Simulates the motion of an object with air resistance and a constant force.
@@ -36,86 +55,493 @@ def simulate_drag(
         force_constant (float): Additional constant force acting on the object (N).
                                 Negative for opposing motion, positive for assisting.
         initial_position (float, optional): Starting position (m). Defaults to 0.0.
-        time_step (float, optional): Simulation time step (s). Defaults to 0.01.
+        time_step (float, optional): Spacing of the returned samples (s). Defaults to 0.01.
         max_time (float, optional): Maximum simulation time (s). Defaults to 100.0.
+        tolerance (float, optional): Velocity (m/s) and position (m) error allowed per
+                                     adaptive integration step. Steps are sized from it
+                                     independently of time_step. Defaults to 1e-9.
 
     Returns:
-        tuple: (times, positions, velocities, drag_forces) - lists of data points.
+        tuple: (times, positions, velocities, drag_forces) - NumPy arrays of data points.
     """
     # --- Input Validation ---
-    if mass <= 0:
+    _validate_inputs(mass, drag_coefficient, cross_sectional_area, fluid_density, time_step, max_time, tolerance)
+
+    # --- Drag-only coasting has an exact solution ---
+    if force_constant == 0 and initial_velocity > 1e-6:
+        return _coast_analytic(
+            initial_velocity, mass, drag_coefficient, cross_sectional_area,
+            fluid_density, initial_position, time_step, max_time
+        )
+
+    # --- Simulation (compiled kernel) ---
+    times, positions, velocities = _simulate_drag_kernel(
+        float(initial_velocity), float(mass), float(drag_coefficient),
+        float(cross_sectional_area), float(fluid_density), float(force_constant),
+        float(initial_position), float(time_step), float(max_time), float(tolerance)
+    )
+    # Drag force magnitude for every sample in one vectorised pass
+    drag_forces = 0.5 * fluid_density * drag_coefficient * cross_sectional_area * (velocities * velocities)
+
+    return times, positions, velocities, drag_forces
+
+def simulate_drag_batch(
+    initial_velocities,
+    masses,
+    drag_coefficients,
+    cross_sectional_areas,
+    fluid_densities,
+    force_constants,
+    initial_positions=0.0,
+    time_step=0.01,
+    max_time=100.0,
+    tolerance=1e-9
+):
+    """
+    Integrates many parameter sets in parallel with the adaptive RK4 kernel.
+
+    Each parameter accepts a scalar or a sequence; they are broadcast against
+    each other to one value per simulation. All runs share time_step,
+    max_time and tolerance. Runs that stop before the longest one hold their
+    final position and velocity for the remaining samples.
+
+    Rows with a constant force match simulate_drag exactly. Drag-only rows
+    (force_constant == 0) are integrated numerically too, whereas
+    simulate_drag evaluates them in closed form, so they can differ from it
+    by the integration tolerance.
+
+    Returns:
+        tuple: (times, positions, velocities, drag_forces) - times has shape
+               (n_steps,), the others (n_sims, n_steps).
+    """
+    (initial_velocities, masses, drag_coefficients, cross_sectional_areas,
+     fluid_densities, force_constants, initial_positions) = (
+        np.ascontiguousarray(param, dtype=np.float64).ravel()
+        for param in np.broadcast_arrays(
+            initial_velocities, masses, drag_coefficients, cross_sectional_areas,
+            fluid_densities, force_constants, initial_positions
+        )
+    )
+
+    # --- Input Validation ---
+    if len(initial_velocities) == 0:
+        raise ValueError("At least one parameter set is required.")
+    _validate_inputs(masses, drag_coefficients, cross_sectional_areas, fluid_densities, time_step, max_time, tolerance)
+
+    # --- Simulation (compiled parallel kernel) ---
+    positions, velocities = _simulate_drag_batch_kernel(
+        initial_velocities, masses, drag_coefficients, cross_sectional_areas,
+        fluid_densities, force_constants, initial_positions,
+        float(time_step), float(max_time), float(tolerance)
+    )
+    times = np.arange(positions.shape[1]) * time_step
+    drag_forces = (0.5 * fluid_densities * drag_coefficients * cross_sectional_areas)[:, None] * (velocities * velocities)
+
+    return times, positions, velocities, drag_forces
+
+def _validate_inputs(mass, drag_coefficient, cross_sectional_area, fluid_density, time_step, max_time, tolerance):
+    """Raises ValueError for physically meaningless parameters (scalars or arrays)."""
+    if np.any(mass <= 0):
         raise ValueError("Mass must be positive.")
-    if time_step <= 0:
-        raise ValueError("Time step must be positive.")
-    if cross_sectional_area < 0: # Allow zero area if drag is not considered
+    if not math.isfinite(time_step) or time_step <= 0:
+        raise ValueError("Time step must be a positive finite number.")
+    if not math.isfinite(max_time) or max_time < 0:
+        raise ValueError("Maximum simulation time must be a non-negative finite number.")
+    if tolerance <= 0:
+        raise ValueError("Tolerance must be positive.")
+    if np.any(cross_sectional_area < 0): # Allow zero area if drag is not considered
         raise ValueError("Cross-sectional area cannot be negative.")
-    if drag_coefficient < 0: # Allow zero Cd if drag is not considered
+    if np.any(drag_coefficient < 0): # Allow zero Cd if drag is not considered
         raise ValueError("Drag coefficient cannot be negative.")
-    if fluid_density < 0: # Allow zero density if drag is not considered
+    if np.any(fluid_density < 0): # Allow zero density if drag is not considered
         raise ValueError("Fluid density cannot be negative.")
 
+@njit(cache=True, fastmath=FASTMATH)
+def _acceleration(velocity, drag_constant, force_constant, inverse_mass):
+    """
+    Acceleration from the constant force and a drag force opposing the motion.
 
-    # --- Simulation Setup ---
-    current_velocity = initial_velocity
-    current_position = initial_position
-    current_time = 0.0
+    drag_constant is 0.5 * rho * Cd * A and inverse_mass is 1 / m, both
+    precomputed once per simulation.
+    """
+    drag_force = drag_constant * velocity * velocity
+    net_force = force_constant - math.copysign(drag_force, velocity) # branchless: drag opposes motion
+    return net_force * inverse_mass
 
-    times = [current_time]
-    positions = [current_position]
-    velocities = [current_velocity]
-    drag_forces = [] # Store drag force at each step
+@njit(cache=True, fastmath=FASTMATH)
+def _rk4_step(velocity, h, drag_constant, force_constant, inverse_mass):
+    """
+    Advances v by one classic RK4 step of size h.
+
+    Returns the new velocity and the displacement over the step; position
+    does not enter dv/dt, so the caller accumulates it separately.
+    """
+    v1 = velocity
+    a1 = _acceleration(v1, drag_constant, force_constant, inverse_mass)
+    v2 = velocity + 0.5 * h * a1
+    a2 = _acceleration(v2, drag_constant, force_constant, inverse_mass)
+    v3 = velocity + 0.5 * h * a2
+    a3 = _acceleration(v3, drag_constant, force_constant, inverse_mass)
+    v4 = velocity + h * a3
+    a4 = _acceleration(v4, drag_constant, force_constant, inverse_mass)
+
+    # Weights (1/6, 1/3, 1/3, 1/6)
+    next_velocity = velocity + h * (a1 + 2 * a2 + 2 * a3 + a4) / 6
+    displacement = h * (v1 + 2 * v2 + 2 * v3 + v4) / 6
+    return next_velocity, displacement
+
+@njit(cache=True, fastmath=FASTMATH)
+def _interpolate(p0, m0, p_mid, p1, m1, h, s):
+    """
+    Quartic interpolant at fraction s of a step of size h.
+
+    Cubic Hermite through the end values p0, p1 and slopes m0, m1, plus a
+    s^2 (1 - s)^2 term that makes it pass through the midpoint value p_mid
+    from the step-doubling half step, which lifts it to the RK4 order.
+    """
+    s2 = s * s
+    s3 = s2 * s
+    cubic = ((2 * s3 - 3 * s2 + 1) * p0 + (s3 - 2 * s2 + s) * h * m0
+             + (3 * s2 - 2 * s3) * p1 + (s3 - s2) * h * m1)
+    cubic_mid = 0.5 * (p0 + p1) + 0.125 * h * (m0 - m1)
+    return cubic + 16 * (p_mid - cubic_mid) * s2 * (1 - s) * (1 - s)
+
+@njit(cache=True, fastmath=FASTMATH)
+def _integrate_drag(
+    mass,
+    drag_coefficient,
+    cross_sectional_area,
+    fluid_density,
+    force_constant,
+    time_step,
+    n_samples,
+    max_step,
+    tolerance,
+    state,
+    positions,
+    velocities,
+    count
+):
+    """
+    Adaptive RK4 integration loop shared by the simulate_drag kernels.
+
+    The state is advanced with step-doubled RK4 steps of size MIN_STEP..max_step
+    whose size follows the local error estimate, independently of the output
+    spacing. Sample i belongs to time i * time_step; every sample that falls
+    inside an accepted step is interpolated from the position, velocity and
+    acceleration at both ends of that step and its half-step midpoint.
+
+    The run is resumable so callers can grow their buffers: state holds
+    (time, position, velocity, Kahan compensation, next step size) at the start
+    of the next step, and the first count samples of positions/velocities are
+    already filled. Integration continues until the object stops, n_samples
+    samples exist, or the buffers are full, and the new count is returned. A
+    step that does not fit the buffers is retaken from state on the next call.
+    """
+    end_time = (n_samples - 1) * time_step
+    last = min(n_samples, len(positions)) - 1
+
+    # Loop-invariant force coefficients
+    drag_constant = 0.5 * fluid_density * drag_coefficient * cross_sectional_area
+    inverse_mass = 1.0 / mass
+
+    # State at the start of the current step
+    step_time = state[0]
+    step_position = state[1]
+    step_velocity = state[2]
+    step_acceleration = _acceleration(step_velocity, drag_constant, force_constant, inverse_mass)
+    position_compensation = state[3] # Kahan running error of the position sum
+    h = state[4]
+
+    i = count - 1
 
-    # --- Simulation Loop (Discrete Steps) ---
     # Stop if velocity becomes zero/negative or max time is reached
-    while current_velocity > 1e-6 and current_time < max_time:
-        # 1. Calculate Drag Force for the *current* velocity
-        #    Force opposes velocity, hence the sign depends on velocity direction.
-        #    Assuming positive initial velocity means drag is negative.
-        drag_force = 0.5 * fluid_density * drag_coefficient * (current_velocity**2) * cross_sectional_area
-        drag_forces.append(drag_force) # Store the magnitude
-
-        # 2. Calculate Net Force
-        #    Drag always opposes motion. Constant force is as given.
-        net_force = force_constant - drag_force if current_velocity > 0 else force_constant + drag_force
-
-        # 3. Calculate Acceleration
-        acceleration = net_force / mass
-
-        # 4. Update Velocity (Euler method)
-        next_velocity = current_velocity + acceleration * time_step
-
-        # 5. Update Position (Euler method using *current* velocity)
-        current_position = current_position + current_velocity * time_step
-
-        # 6. Update Time
-        current_time += time_step
-
-        # 7. Store Results
-        #    Prevent velocity becoming negative due to discrete step overshoot
-        current_velocity = max(0, next_velocity)
-        times.append(current_time)
-        positions.append(current_position)
-        velocities.append(current_velocity)
-
-    # Add one last drag force calculation if the loop terminated
-    if velocities:
-        last_drag = 0.5 * fluid_density * drag_coefficient * (velocities[-1]**2) * cross_sectional_area
-        drag_forces.append(last_drag)
-        # Pad drag_forces if it's shorter than velocities (e.g., started at v=0)
-        while len(drag_forces) < len(velocities):
-             drag_forces.append(0) # Or handle appropriately if needed
-
-
-    print(f"\nSimulation finished at time {current_time:.2f}s")
-    if current_velocity <= 1e-6:
-        print(f"Object stopped (velocity ~ 0 m/s).")
-    elif current_time >= max_time:
-        print(f"Maximum simulation time ({max_time}s) reached.")
+    while velocities[i] > 1e-6 and i < last:
+        # 1. Take one adaptive step, never past the last sample
+        h_try = min(h, end_time - step_time)
+
+        # Compare one full step against two half steps
+        v_full, dx_full = _rk4_step(
+            step_velocity, h_try,
+            drag_constant, force_constant, inverse_mass
+        )
+        v_mid, dx_first = _rk4_step(
+            step_velocity, 0.5 * h_try,
+            drag_constant, force_constant, inverse_mass
+        )
+        v_half, dx_second = _rk4_step(
+            v_mid, 0.5 * h_try,
+            drag_constant, force_constant, inverse_mass
+        )
+        error = max(abs(v_full - v_half), abs(dx_full - (dx_first + dx_second)))
+
+        if error > tolerance and h_try > MIN_STEP:
+            # Reject and retry with a smaller step
+            h = max(MIN_STEP, h_try * max(0.1, 0.9 * (tolerance / error) ** 0.25))
+            continue
+
+        # Accept the more accurate two-half-step result. Compensated (Kahan)
+        # sum keeps many small displacements from losing their low-order bits
+        # against a large position.
+        dx = (dx_first + dx_second) - position_compensation
+        next_position = step_position + dx
+        next_compensation = (next_position - step_position) - dx
+        next_velocity = v_half
+        next_acceleration = _acceleration(next_velocity, drag_constant, force_constant, inverse_mass)
+        next_time = step_time + h_try
+
+        # 2. Fill every sample inside the accepted step
+        while i < last and (i + 1) * time_step <= next_time + 1e-9 * time_step:
+            i += 1
+            s = min(1.0, (i * time_step - step_time) / h_try)
+            positions[i] = _interpolate(
+                step_position, step_velocity, step_position + dx_first,
+                next_position, next_velocity, h_try, s
+            )
+            velocities[i] = max(0.0, _interpolate(
+                step_velocity, step_acceleration, v_mid,
+                next_velocity, next_acceleration, h_try, s
+            ))
+            if velocities[i] <= 1e-6:
+                return i + 1
+
+        # Buffers full before the step is used up: retake it after growing
+        step_needs_more = (i + 1) * time_step <= next_time + 1e-9 * time_step or next_velocity <= 0
+        if i == last and last < n_samples - 1 and step_needs_more:
+            state[4] = h_try
+            return i + 1
+
+        # 3. Prevent overshoot below zero velocity; a stopped object stays put
+        if next_velocity <= 0 and i < last:
+            i += 1
+            positions[i] = next_position
+            velocities[i] = 0.0
+            return i + 1
+
+        # Size the next step from the error; a step shortened to land on the
+        # last sample says nothing about how large steps may be
+        if error > 0:
+            h_next = min(max_step, h_try * min(4.0, 0.9 * (tolerance / error) ** 0.2))
+        else:
+            h_next = min(max_step, 4.0 * h_try)
+        h = h_next if h_try == h else max(h, h_next)
+
+        step_time = next_time
+        step_position = next_position
+        step_velocity = next_velocity
+        step_acceleration = next_acceleration
+        position_compensation = next_compensation
+        state[0] = step_time
+        state[1] = step_position
+        state[2] = step_velocity
+        state[3] = position_compensation
+        state[4] = h
+
+    return i + 1
+
+@njit(cache=True, fastmath=FASTMATH)
+def _grow(array, size):
+    """Copy of a 1-D array enlarged to size entries."""
+    grown = np.empty(size)
+    grown[:array.shape[0]] = array
+    return grown
+
+@njit(cache=True, fastmath=FASTMATH)
+def _grow_rows(array, size):
+    """Copy of a 2-D array with every row enlarged to size entries."""
+    grown = np.empty((array.shape[0], size))
+    grown[:, :array.shape[1]] = array
+    return grown
+
+@njit(cache=True, fastmath=FASTMATH)
+def _max_samples(time_step, max_time):
+    """Number of samples on the grid 0, time_step, ... up to the first time >= max_time."""
+    return int(math.ceil(round(max_time / time_step, 9))) + 1
+
+@njit(cache=True, fastmath=FASTMATH)
+def _max_step(time_step, max_time):
+    """Largest adaptive step: a fixed fraction of the run, but never below the sample spacing."""
+    return max(time_step, MAX_STEP_FRACTION * max_time)
+
+@njit(cache=True, fastmath=FASTMATH)
+def _simulate_drag_kernel(
+    initial_velocity,
+    mass,
+    drag_coefficient,
+    cross_sectional_area,
+    fluid_density,
+    force_constant,
+    initial_position,
+    time_step,
+    max_time,
+    tolerance
+):
+    """
+    Compiled single run behind simulate_drag.
+
+    Takes validated scalars and returns arrays trimmed to the number of
+    samples actually taken; drag forces are derived from the velocities
+    afterwards by the caller. The buffers start at INITIAL_SAMPLES and double
+    when full, so a run that stops early never pays for max_time.
+    """
+    n = _max_samples(time_step, max_time)
+    max_step = _max_step(time_step, max_time)
+    size = min(n, INITIAL_SAMPLES)
+    positions = np.empty(size)
+    velocities = np.empty(size)
+    positions[0] = initial_position
+    velocities[0] = initial_velocity
+    state = np.array([0.0, initial_position, initial_velocity, 0.0, min(time_step, max_step)])
+
+    count = 1
+    while True:
+        count = _integrate_drag(
+            mass, drag_coefficient, cross_sectional_area, fluid_density,
+            force_constant, time_step, n, max_step, tolerance,
+            state, positions, velocities, count
+        )
+        if count < size or count == n or velocities[count - 1] <= 1e-6:
+            break
+        size = min(n, 2 * size)
+        positions = _grow(positions, size)
+        velocities = _grow(velocities, size)
+
+    times = np.arange(count) * time_step
+    return times, positions[:count], velocities[:count]
+
+@njit(cache=True, fastmath=FASTMATH, parallel=True)
+def _advance_batch(
+    masses,
+    drag_coefficients,
+    cross_sectional_areas,
+    fluid_densities,
+    force_constants,
+    time_step,
+    n_samples,
+    max_step,
+    tolerance,
+    states,
+    positions,
+    velocities,
+    counts,
+    running
+):
+    """Resumes every still-running row of a sweep on its own thread until it stops or fills its row."""
+    width = positions.shape[1]
+    for k in prange(len(counts)):
+        if running[k]:
+            count = _integrate_drag(
+                masses[k], drag_coefficients[k], cross_sectional_areas[k],
+                fluid_densities[k], force_constants[k], time_step, n_samples,
+                max_step, tolerance, states[k], positions[k], velocities[k],
+                counts[k]
+            )
+            counts[k] = count
+            running[k] = count == width and count < n_samples and velocities[k, count - 1] > 1e-6
+
+@njit(cache=True, fastmath=FASTMATH)
+def _simulate_drag_batch_kernel(
+    initial_velocities,
+    masses,
+    drag_coefficients,
+    cross_sectional_areas,
+    fluid_densities,
+    force_constants,
+    initial_positions,
+    time_step,
+    max_time,
+    tolerance
+):
+    """
+    Compiled parameter sweep behind simulate_drag_batch.
+
+    Each simulation is integrated independently on its own thread into one
+    row of the output arrays (see _advance_batch). The rows start
+    INITIAL_SAMPLES wide and double whenever a still-running simulation fills
+    its row, after which only the unfinished rows resume. Rows that stop early
+    are padded with their final state, and the columns are trimmed to the
+    longest run.
+    """
+    n_sims = len(initial_velocities)
+    n = _max_samples(time_step, max_time)
+    max_step = _max_step(time_step, max_time)
+    width = min(n, INITIAL_SAMPLES)
+    positions = np.empty((n_sims, width))
+    velocities = np.empty((n_sims, width))
+    states = np.empty((n_sims, 5))
+    counts = np.ones(n_sims, dtype=np.int64)
+    running = np.ones(n_sims, dtype=np.bool_)
+
+    for k in range(n_sims):
+        positions[k, 0] = initial_positions[k]
+        velocities[k, 0] = initial_velocities[k]
+        states[k, 0] = 0.0
+        states[k, 1] = initial_positions[k]
+        states[k, 2] = initial_velocities[k]
+        states[k, 3] = 0.0
+        states[k, 4] = min(time_step, max_step)
+
+    # The parallel loop lives in its own kernel so the buffers can be
+    # replaced here between passes
+    while True:
+        _advance_batch(
+            masses, drag_coefficients, cross_sectional_areas, fluid_densities,
+            force_constants, time_step, n, max_step, tolerance,
+            states, positions, velocities, counts, running
+        )
+        if not running.any():
+            break
+        width = min(n, 2 * width)
+        positions = _grow_rows(positions, width)
+        velocities = _grow_rows(velocities, width)
+
+    longest = counts.max()
+    for k in range(n_sims):
+        positions[k, counts[k]:longest] = positions[k, counts[k] - 1]
+        velocities[k, counts[k]:longest] = velocities[k, counts[k] - 1]
+    return positions[:, :longest], velocities[:, :longest]
+
+def _coast_analytic(
+    initial_velocity,
+    mass,
+    drag_coefficient,
+    cross_sectional_area,
+    fluid_density,
+    initial_position,
+    time_step,
+    max_time
+):
+    """
+    Closed-form solution of m dv/dt = -k v^2 with k = 0.5 * rho * Cd * A.
+
+    v(t) = v0 / (1 + k v0 t / m) and x(t) = x0 + (m / k) ln(1 + k v0 t / m),
+    evaluated on the same sample grid _integrate_drag writes to.
+    """
+    times = np.arange(_max_samples(time_step, max_time)) * time_step
+
+    k = 0.5 * fluid_density * drag_coefficient * cross_sectional_area
+    if k > 0:
+        decay = k * initial_velocity / mass * times
+        velocities = initial_velocity / (1 + decay)
+        positions = initial_position + mass / k * np.log1p(decay)
+    else:
+        velocities = np.full_like(times, initial_velocity)
+        positions = initial_position + initial_velocity * times
+
+    # Mirror _integrate_drag's v <= 1e-6 stopping rule
+    stopped = np.flatnonzero(velocities <= 1e-6)
+    if stopped.size:
+        end = stopped[0] + 1
+        times, positions, velocities = times[:end], positions[:end], velocities[:end]
+
+    drag_forces = k * velocities * velocities
 
     return times, positions, velocities, drag_forces
 
 def plot_results(times, positions, velocities):
     """Plots and saves the simulation results."""
+    import matplotlib.pyplot as plt # imported lazily so importing this module stays cheap
+
     fig, ax1 = plt.subplots(figsize=(10, 6))
 
     color = 'tab:red'
@@ -154,7 +580,7 @@ if __name__ == "__main__":
     area = get_float_input("Cross-sectional Area (m^2): ")
     rho = get_float_input("Fluid Density (kg/m^3, air≈1.225): ")
     f_const = get_float_input("Constant Force (N, negative for resistance): ")
-    dt = get_float_input("Time Step (s, smaller is more accurate, e.g., 0.01): ")
+    dt = get_float_input("Time Step (s, spacing of the output samples, e.g., 0.01): ")
     t_max = get_float_input("Maximum Simulation Time (s): ")
 
     # Run simulation
@@ -170,10 +596,19 @@ if __name__ == "__main__":
             max_time=t_max
         )
 
+        # Report why the simulation ended, kept out of simulate_drag so
+        # repeated or batched calls stay silent
+        if len(t_data):
+            print(f"\nSimulation finished at time {t_data[-1]:.2f}s")
+            if v_data[-1] <= 1e-6:
+                print(f"Object stopped (velocity ~ 0 m/s).")
+            elif t_data[-1] >= t_max:
+                print(f"Maximum simulation time ({t_max}s) reached.")
+
         # Print final air resistance if object stopped or simulation ended
-        if v_data:
+        if len(v_data):
              final_velocity = v_data[-1]
-             final_drag = 0.5 * rho * cd * (final_velocity**2) * area
+             final_drag = drag_data[-1]
              print(f"Final Velocity: {final_velocity:.4f} m/s")
              print(f"Final Drag Force: {final_drag:.4f} N")
         else:
@@ -181,7 +616,7 @@ if __name__ == "__main__":
 
 
         # Plot results
-        if t_data: # Check if there's data to plot
+        if len(t_data): # Check if there's data to plot
              plot_results(t_data, x_data, v_data)
         else:
              print("No data to plot.")
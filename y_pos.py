@@ -1,56 +1,58 @@
-from copy import copy
-import json
+import math
+import numpy as np
 
 tick_speed = 0.01 # seconds
 velocity = 40.45 # m/s or 90.5 mph
 initial_x = 0 # feet
 initial_y = 0 # feet
 
-vel_equation = lambda t, v: v - (9.81)*t
-
-vel_zero = False
-time = 0
-iter_vel = copy(velocity)
-velocity_timeline = []
-while not vel_zero:
-    if iter_vel <= -velocity:
-        vel_zero = True
-    # calculate drag based on v
-    iter_vel = vel_equation(tick_speed, iter_vel)
-    time += tick_speed
-    velocity_timeline.append(iter_vel)
-
-with open('velocity_y.json', 'w') as f:
-    json.dump(velocity_timeline, f, indent=4)
-
-y_pos_timeline = []
-y_current = copy(initial_y)
-for vel in velocity_timeline:
-    y_progress = vel*tick_speed
-    y_current += y_progress
-    y_pos_timeline.append(y_current)
-
-with open('y_pos.json', 'w') as f:
-    json.dump(y_pos_timeline, f, indent=4)
-
-# graph and save y-position over time
-
-import matplotlib.pyplot as plt
-
-# Generate a time vector for plotting
-time_timeline = [tick_speed * i for i in range(len(y_pos_timeline))]
-
-# Plot positions over time
-plt.figure(figsize=(10, 6))
-plt.plot(time_timeline, y_pos_timeline, label='Rectangle Position', color='blue')
-
-# Add labels, legend, and title
-plt.xlabel('Time (seconds)')
-plt.ylabel('Position (meters)')
-plt.title('Position of Rectangle and Boat Over Time')
-plt.legend()
-plt.grid()
-plt.savefig("y_position_car.png", dpi=300)
-
-# Show the plot
-plt.show()
\ No newline at end of file
+g = 9.81 # m/s^2
+
+# dv/dt = -g has the exact solution v(t) = v0 - g t, y(t) = y0 + v0 t - g t^2 / 2,
+# evaluated through the first tick at which the velocity has fully reversed
+# (v <= -v0, i.e. back on the ground). Every sample is computed
+# independently, so float32 keeps well over 4 decimals here.
+n = math.ceil(2*velocity/g/tick_speed) + 1
+t = np.arange(n, dtype=np.float32)*np.float32(tick_speed)
+velocity_timeline = velocity - g*t
+y_pos_timeline = initial_y + velocity*t - 0.5*g*t*t
+
+if __name__ == "__main__":
+    import argparse
+    import matplotlib
+
+    parser = argparse.ArgumentParser(description="Simulate and plot the vertical position of the car.")
+    parser.add_argument("--headless", action="store_true",
+                        help="only save the plot, using the non-GUI Agg backend")
+    args = parser.parse_args()
+
+    # binary .npy avoids formatting every float as text
+    np.save('velocity_y.npy', velocity_timeline)
+    np.save('y_pos.npy', y_pos_timeline)
+
+    # graph and save y-position over time
+
+    # pyplot is imported here so importing this module stays cheap;
+    # Agg skips GUI toolkit initialisation when no window is wanted
+    if args.headless:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # The samples were evaluated on the time grid t, so plot against it directly
+    time_timeline = t
+
+    # Plot positions over time
+    plt.figure(figsize=(10, 6))
+    plt.plot(time_timeline, y_pos_timeline, label='Rectangle Position', color='blue')
+
+    # Add labels, legend, and title
+    plt.xlabel('Time (seconds)')
+    plt.ylabel('Position (meters)')
+    plt.title('Position of Rectangle and Boat Over Time')
+    plt.legend()
+    plt.grid()
+    plt.savefig("y_position_car.png", dpi=300)
+
+    # Show the plot
+    if not args.headless:
+        plt.show()